@@ -1,11 +1,8 @@
 import json
+import os
 import sys
 
-# ANSI color codes
-class Color:
-    GREEN = '\033[92m'
-    CYAN = '\033[96m'
-    RESET = '\033[0m'
+from pack_common import Color, c
 
 
 def main():
@@ -15,20 +12,39 @@ def main():
     groups = data.get("groups", [])
     project_id = data.get("modrinth_project_id")
     
-    print(f"{Color.CYAN}[*] Extracting {len(groups)} pack format groups{Color.RESET}", file=sys.stderr)
+    # Collect log lines and write them to stderr in one go
+    log = [c(Color.CYAN, f"[*] Extracting {len(groups)} pack format groups")]
+    
+    # KEY=value lines for the workflow
+    out = []
     
     # Output project ID if available
     if project_id:
-        print(f"MODRINTH_PROJECT_UUID={project_id}")
-        print(f"{Color.GREEN}  [+] Modrinth project UUID: {project_id}{Color.RESET}", file=sys.stderr)
+        out.append(f"MODRINTH_PROJECT_UUID={project_id}")
+        log.append(c(Color.GREEN, f"  [+] Modrinth project UUID: {project_id}"))
     
     for i, group in enumerate(groups):
         versions = ",".join(group.get("versions", []))
         pf = group.get('pack_format')
-        print(f"GROUP_{i}_VERSIONS={versions}")
-        print(f"GROUP_{i}_PACK_FORMAT={pf}")
-        print(f"{Color.GREEN}  [+] Group {i}: PF{pf} with {len(group.get('versions', []))} versions{Color.RESET}", file=sys.stderr)
-    print(f"TOTAL_GROUPS={len(groups)}")
+        out.append(f"GROUP_{i}_VERSIONS={versions}")
+        out.append(f"GROUP_{i}_PACK_FORMAT={pf}")
+        log.append(c(Color.GREEN, f"  [+] Group {i}: PF{pf} with {len(group.get('versions', []))} versions"))
+    out.append(f"TOTAL_GROUPS={len(groups)}")
+    
+    payload = ("\n".join(out) + "\n").encode()
+    
+    # In GitHub Actions, append straight to the step output and env files;
+    # locally, fall back to printing the lines
+    github_output = os.environ.get("GITHUB_OUTPUT")
+    if github_output:
+        for target in (github_output, os.environ.get("GITHUB_ENV")):
+            if target:
+                with open(target, "ab") as f:
+                    f.write(payload)
+    else:
+        sys.stdout.buffer.write(payload)
+    
+    sys.stderr.write("\n".join(log) + "\n")
 
 
 if __name__ == "__main__":
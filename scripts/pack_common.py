@@ -0,0 +1,70 @@
+"""
+Pack Automation Helpers
+Small helpers shared by the scripts in this directory, which import this
+module by name since they are run from here.
+"""
+
+import json
+import os
+import re
+import sys
+
+# orjson is optional; it parses and serializes JSON much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# packaging is optional; without it versions are compared by their numeric parts
+try:
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    Version = None
+
+
+# ANSI color codes
+class Color:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    BOLD = '\033[1m'
+    RESET = '\033[0m'
+
+
+# Only emit ANSI codes to an interactive terminal, and honour NO_COLOR
+_USE_COLOR = sys.stderr.isatty() and not os.environ.get("NO_COLOR")
+
+# Pick the helper once at import so each call is a plain concatenation
+if _USE_COLOR:
+    def c(color: str, s: str) -> str:
+        """Wrap s in an ANSI color code."""
+        return color + s + Color.RESET
+else:
+    def c(color: str, s: str) -> str:
+        """Color output is disabled; return s unchanged."""
+        return s
+
+
+# Parse JSON from str or bytes with whichever backend is loaded
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumps(obj, newline: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, optionally followed by a newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE if newline else 0)
+    data = json.dumps(obj).encode()
+    return data + b"\n" if newline else data
+
+
+def version_key(version: str):
+    """Sort key that orders versions and tags numerically (1.9 < 1.10)."""
+    numeric = tuple(int(x) for x in re.findall(r'\d+', version))
+    if Version is None:
+        return numeric
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return Version(".".join(map(str, numeric)) or "0")
@@ -2,29 +2,68 @@ import json
 import os
 import subprocess
 import sys
+from functools import lru_cache
 
-# ANSI color codes
-class Color:
-    GREEN = '\033[92m'
-    CYAN = '\033[96m'
-    YELLOW = '\033[93m'
-    RESET = '\033[0m'
+from pack_common import Color, version_key
 
+# dulwich is optional; it reads tags in-process instead of forking git
+try:
+    from dulwich.repo import Repo
+except ImportError:
+    Repo = None
 
+
+# version.json keys to try, in priority order
+_VERSION_KEYS = ("version", "pack_version", "name")
+
+
+@lru_cache(maxsize=32)
 def read_from_version_json(path: str) -> str | None:
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
-        return (
-            data.get("version")
-            or data.get("pack_version")
-            or data.get("name")
-        )
+        for key in _VERSION_KEYS:
+            value = data.get(key)
+            if value:
+                return value
+        return None
     except Exception:
         return None
 
 
+def _read_latest_tag_dulwich() -> str | None:
+    repo = Repo.discover()
+    # Annotated tags point at tag objects; key every tag by its commit
+    tags_by_commit = {}
+    for ref in repo.get_refs():
+        if ref.startswith(b"refs/tags/"):
+            tags_by_commit.setdefault(repo.get_peeled(ref), []).append(ref[len(b"refs/tags/"):].decode())
+    if not tags_by_commit:
+        return None
+    for entry in repo.get_walker(include=[repo.head()]):
+        tags = tags_by_commit.get(entry.commit.id)
+        if tags:
+            return max(tags, key=version_key)
+    return None
+
+
+@lru_cache(maxsize=1)
 def read_latest_tag() -> str | None:
+    """
+    Return the nearest tag reachable from HEAD, like git describe --tags
+    --abbrev=0; tags on other branches are ignored. When several tags point
+    at that commit, the highest version wins.
+    
+    Reads the repository in-process with dulwich when it is installed, and
+    runs git when it isn't or when dulwich can't read the repository.
+    """
+    if Repo is not None:
+        try:
+            return _read_latest_tag_dulwich()
+        except Exception:
+            # e.g. a shallow clone or a repository format dulwich doesn't support
+            pass
+
     try:
         return subprocess.check_output(
             ["git", "describe", "--tags", "--abbrev=0"],
@@ -5,37 +5,154 @@ Fetches Minecraft releases and Modrinth versions to identify missing uploads.
 Uses misode/mcmeta API for accurate, auto-updating pack format data.
 """
 
-import json
+import gzip
+import hashlib
 import os
+import shutil
 import sys
+import tempfile
+import time
+import urllib.error
 import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Optional
 
-# ANSI color codes
-class Color:
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    BOLD = '\033[1m'
-    RESET = '\033[0m'
+from pack_common import Color, c, json_dumps, json_loads, version_key
 
+# ijson is optional; it lets us walk data.json one record at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-@dataclass
-class MinecraftVersion:
-    """Represents a Minecraft release version."""
-    version: str
-    pack_format: int
+# urllib3 is optional; it keeps connections alive across the API calls
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
 
 
-@dataclass
-class MinecraftVersion:
-    """Represents a Minecraft release version."""
-    version: str
-    pack_format: int
+USER_AGENT = 'XYZ-Classic-Panorama-Updater/1.0'
+
+MCMETA_VERSIONS_URL = "https://raw.githubusercontent.com/misode/mcmeta/summary/versions/data.json"
+
+# Shared, thread-safe connection pool (None when urllib3 is missing)
+_http = urllib3.PoolManager() if urllib3 is not None else None
+
+# Conditional-GET cache (persisted between workflow runs by actions/cache)
+HTTP_CACHE_DIR = Path(
+    os.environ.get("PACK_AUTOMATION_CACHE_DIR")
+    or Path.home() / ".cache" / "pack-automation"
+)
+
+# Slug -> project UUID mappings; these rarely change, and a stale entry is
+# dropped as soon as Modrinth answers 404 for it
+PROJECT_ID_CACHE = HTTP_CACHE_DIR / "modrinth_project_ids.json"
+
+# Seconds a cached project UUID is trusted; MODRINTH_PID_CACHE_TTL overrides
+PROJECT_ID_CACHE_TTL = 7 * 24 * 60 * 60
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path via a temp file so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@contextmanager
+def _urlopen(url: str, headers: dict, timeout: int):
+    """
+    Open a GET request and yield (headers, body) with the body already
+    gzip-decoded.
+    
+    Uses the pooled urllib3 client when available so repeated calls to the
+    same host reuse one TLS connection. Non-2xx statuses (including 304) are
+    raised as urllib.error.HTTPError on both paths.
+    """
+    if _http is not None:
+        response = _http.request("GET", url, headers=headers, timeout=timeout, preload_content=False)
+        try:
+            if response.status >= 300:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            yield response.headers, response
+        finally:
+            response.release_conn()
+        return
+    
+    req = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        if response.headers.get("Content-Encoding") == "gzip":
+            with gzip.GzipFile(fileobj=response) as body:
+                yield response.headers, body
+        else:
+            yield response.headers, response
+
+
+def _http_get(url: str, timeout: int = 10) -> Path:
+    """
+    GET a URL through the on-disk HTTP cache.
+    
+    Sends If-None-Match/If-Modified-Since from the previous response, so an
+    unchanged resource costs a 304 instead of a full download.
+    
+    Returns:
+        Path to the cached response body. HTTP errors other than 304 propagate.
+    """
+    key = hashlib.sha1(url.encode()).hexdigest()
+    body_path = HTTP_CACHE_DIR / f"{key}.body"
+    meta_path = HTTP_CACHE_DIR / f"{key}.json"
+    
+    meta = {}
+    if body_path.exists() and meta_path.exists():
+        try:
+            meta = json_loads(meta_path.read_bytes())
+        except Exception:
+            meta = {}
+    
+    headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip'}
+    if meta.get("etag"):
+        headers['If-None-Match'] = meta["etag"]
+    if meta.get("last_modified"):
+        headers['If-Modified-Since'] = meta["last_modified"]
+    
+    try:
+        with _urlopen(url, headers, timeout) as (response_headers, body):
+            HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=HTTP_CACHE_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    shutil.copyfileobj(body, f)
+                os.replace(tmp_path, body_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            meta = {
+                "url": url,
+                "etag": response_headers.get("ETag"),
+                "last_modified": response_headers.get("Last-Modified"),
+            }
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and meta:
+            return body_path
+        raise
+    
+    _write_atomic(meta_path, json_dumps(meta))
+    return body_path
+
+
+def _http_get_json(url: str, timeout: int = 10):
+    """GET a URL through the HTTP cache and parse the body as JSON."""
+    return json_loads(_http_get(url, timeout).read_bytes())
 
 
 def get_pack_version() -> str:
@@ -46,8 +163,13 @@ def get_pack_version() -> str:
     2. VERSION file in current working directory (caller repo)
     3. VERSION file next to automation scripts (for local runs)
     """
+    return _resolve_pack_version(os.environ.get("PACK_VERSION", ""))
+
+
+@lru_cache(maxsize=1)
+def _resolve_pack_version(env_ver: str = "") -> str:
+    """Cached body of get_pack_version, keyed on the PACK_VERSION value."""
     # 1. Environment variable provided by workflow
-    env_ver = os.environ.get("PACK_VERSION")
     if env_ver:
         return env_ver.strip()
 
@@ -73,25 +195,21 @@ def get_pack_version() -> str:
     sys.exit(1)
 
 
-def fetch_minecraft_releases() -> List[MinecraftVersion]:
+def _iter_releases():
     """
-    Fetch all Minecraft Java release versions with pack formats from misode/mcmeta API.
-    This API is automatically updated and includes accurate resource pack format data.
-    
-    Returns:
-        List of MinecraftVersion objects for release versions only.
+    Yield (version, pack_format) for every release in misode/mcmeta, then
+    report any releases that had to be skipped.
     """
-    try:
-        # Fetch comprehensive version data from misode/mcmeta (community-maintained, auto-updated)
-        url = "https://raw.githubusercontent.com/misode/mcmeta/summary/versions/data.json"
-        req = urllib.request.Request(url)
-        req.add_header('User-Agent', 'XYZ-Classic-Panorama-Updater/1.0')
-        
-        with urllib.request.urlopen(req, timeout=30) as response:
-            versions_data = json.loads(response.read().decode())
-        
-        releases = []
-        skipped = []
+    # Fetch comprehensive version data from misode/mcmeta (community-maintained, auto-updated)
+    body_path = _http_get(MCMETA_VERSIONS_URL, timeout=30)
+    skipped = []
+    
+    with open(body_path, "rb") as f:
+        # Stream records one at a time when ijson is available
+        if ijson is not None:
+            versions_data = ijson.items(f, "item")
+        else:
+            versions_data = json_loads(f.read())
         
         for version_obj in versions_data:
             # Only process release versions (skip snapshots, pre-releases, etc.)
@@ -102,78 +220,169 @@ def fetch_minecraft_releases() -> List[MinecraftVersion]:
             resource_pack_version = version_obj.get("resource_pack_version")
             
             if version_str and resource_pack_version is not None:
-                releases.append(MinecraftVersion(version=version_str, pack_format=resource_pack_version))
+                yield version_str, resource_pack_version
             else:
                 skipped.append(version_str)
-        
-        if skipped:
-            print(f"[!] Skipped {len(skipped)} versions without pack_format data: {', '.join(skipped[:5])}{'...' if len(skipped) > 5 else ''}", file=sys.stderr)
-        
-        print(f"[+] Found {len(releases)} Minecraft release versions with resource pack formats", file=sys.stderr)
-        return releases
     
+    if skipped:
+        print(f"[!] Skipped {len(skipped)} versions without pack_format data: {', '.join(skipped[:5])}{'...' if len(skipped) > 5 else ''}", file=sys.stderr)
+
+
+def _exit_mcmeta_error(e: Exception) -> None:
+    """Report a misode/mcmeta failure and exit; the data is required."""
+    print(f"ERROR: Failed to fetch Minecraft releases from misode/mcmeta API: {e}", file=sys.stderr)
+    print(f"ERROR: This API is required for accurate pack format data.", file=sys.stderr)
+    print(f"ERROR: Check your internet connection or try again later.", file=sys.stderr)
+    sys.exit(1)
+
+
+def fetch_minecraft_releases_grouped() -> Dict[int, List[str]]:
+    """
+    Fetch all Minecraft Java release versions from misode/mcmeta API, bucketed
+    by resource pack format in the same pass that reads the payload.
+    This API is automatically updated and includes accurate resource pack format data.
+    
+    Returns:
+        Dict mapping pack_format to its release version strings, in
+        misode/mcmeta order (newest first).
+    """
+    try:
+        by_pf = defaultdict(list)
+        count = 0
+        for version, pack_format in _iter_releases():
+            by_pf[pack_format].append(version)
+            count += 1
     except Exception as e:
-        print(f"ERROR: Failed to fetch Minecraft releases from misode/mcmeta API: {e}", file=sys.stderr)
-        print(f"ERROR: This API is required for accurate pack format data.", file=sys.stderr)
-        print(f"ERROR: Check your internet connection or try again later.", file=sys.stderr)
-        sys.exit(1)
+        _exit_mcmeta_error(e)
+    
+    print(f"[+] Found {count} Minecraft release versions with resource pack formats", file=sys.stderr)
+    return dict(by_pf)
+
+
+def _cached_project_id(project_id_or_slug: str) -> Optional[str]:
+    """Return a previously resolved project UUID, honouring MODRINTH_PID_CACHE_TTL."""
+    try:
+        entry = json_loads(PROJECT_ID_CACHE.read_bytes()).get(project_id_or_slug)
+    except Exception:
+        return None
+    if not entry:
+        return None
+    
+    ttl = os.environ.get("MODRINTH_PID_CACHE_TTL") or PROJECT_ID_CACHE_TTL
+    try:
+        if time.time() - entry["cached_at"] > float(ttl):
+            return None
+    except (KeyError, TypeError, ValueError):
+        return None
+    return entry.get("id")
+
+
+def _store_project_id(project_id_or_slug: str, pid: str) -> None:
+    """Record a resolved project UUID; failures only cost a future lookup."""
+    try:
+        cache = json_loads(PROJECT_ID_CACHE.read_bytes())
+    except Exception:
+        cache = {}
+    cache[project_id_or_slug] = {"id": pid, "cached_at": time.time()}
+    try:
+        PROJECT_ID_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(PROJECT_ID_CACHE, json_dumps(cache))
+    except OSError as e:
+        print(f"WARNING: Could not write Modrinth project id cache: {e}", file=sys.stderr)
+
+
+def _forget_project_id(project_id_or_slug: str) -> None:
+    """Drop a cached project UUID that Modrinth no longer recognises."""
+    try:
+        cache = json_loads(PROJECT_ID_CACHE.read_bytes())
+    except Exception:
+        return
+    if cache.pop(project_id_or_slug, None) is None:
+        return
+    try:
+        _write_atomic(PROJECT_ID_CACHE, json_dumps(cache))
+    except OSError as e:
+        print(f"WARNING: Could not write Modrinth project id cache: {e}", file=sys.stderr)
 
 
 def resolve_modrinth_project_id(project_id_or_slug: str) -> Optional[str]:
     """Resolve a Modrinth project ID from a slug or ID.
 
     Tries `GET /v2/project/{id_or_slug}`. Returns None if not found (first upload).
-    Returns the canonical UUID `id` if found.
+    Returns the canonical UUID `id` if found. Successful lookups are cached on
+    disk, so later runs skip the request entirely.
     """
+    pid = _cached_project_id(project_id_or_slug)
+    if pid:
+        return pid
+    
     try:
         url = f"https://api.modrinth.com/v2/project/{project_id_or_slug}"
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode())
+        data = _http_get_json(url)
         pid = data.get("id") or data.get("project_id")
         if not pid:
             print(f"WARNING: Unable to resolve Modrinth project id from '{project_id_or_slug}'", file=sys.stderr)
             return None
+        _store_project_id(project_id_or_slug, pid)
         return pid
     except urllib.error.HTTPError as e:
         if e.code == 404:
-            print(f"{Color.YELLOW}[!] Project '{project_id_or_slug}' not found on Modrinth (possibly first upload){Color.RESET}", file=sys.stderr)
+            print(c(Color.YELLOW, f"[!] Project '{project_id_or_slug}' not found on Modrinth (possibly first upload)"), file=sys.stderr)
             return None
-        print(f"{Color.RED}ERROR: Modrinth API error while resolving project: {e}{Color.RESET}", file=sys.stderr)
+        print(c(Color.RED, f"ERROR: Modrinth API error while resolving project: {e}"), file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"ERROR: Failed to resolve Modrinth project id: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def fetch_modrinth_versions(project_id_or_slug: str) -> dict:
+def _no_modrinth_versions() -> dict:
+    """Result of fetch_modrinth_versions for a project that doesn't exist yet."""
+    print(c(Color.CYAN, "[+] No existing versions on Modrinth - all pack formats will be uploaded"), file=sys.stderr)
+    return {'project_id': None, 'game_versions': set(), 'pack_versions': {}}
+
+
+def fetch_modrinth_versions(project_id_or_slug: str, project_uuid: Optional[str]) -> dict:
     """
     Fetch all versions currently uploaded to Modrinth.
     
+    If Modrinth answers 404 for project_uuid, it is assumed to be a stale
+    cache entry: it is dropped and the project resolved again, once.
+    
     Args:
-        project_id: Modrinth project ID (slug or UUID)
+        project_id_or_slug: Modrinth project ID or slug, as given on the command line
+        project_uuid: The project's UUID from resolve_modrinth_project_id, or
+            None if the project doesn't exist yet (first upload)
     
     Returns:
         Dict with:
+        - 'project_id': The project UUID the versions were fetched for (None on first upload)
         - 'game_versions': Set of Minecraft versions (e.g., {"1.20.1", "1.21"})
-        - 'pack_versions': Dict mapping pack version to game versions
-          (e.g., {"1.0.0": ["1.20", "1.20.1"], "1.1.0": ["1.21"]})
+        - 'pack_versions': Dict mapping pack version to its set of game versions
+          (e.g., {"1.0.0": {"1.20", "1.20.1"}, "1.1.0": {"1.21"}})
     """
+    if project_uuid is None:
+        return _no_modrinth_versions()
+    
     try:
-        # Resolve to canonical project id first (supports slug or id)
-        canonical_id = resolve_modrinth_project_id(project_id_or_slug)
-        
-        # If project doesn't exist yet (first upload), return empty sets
-        if canonical_id is None:
-            print(f"{Color.CYAN}[+] No existing versions on Modrinth - all pack formats will be uploaded{Color.RESET}", file=sys.stderr)
-            return {'game_versions': set(), 'pack_versions': {}}
-        
-        url = f"https://api.modrinth.com/v2/project/{canonical_id}/versions"
-        with urllib.request.urlopen(url, timeout=10) as response:
-            versions = json.loads(response.read().decode())
+        try:
+            versions = _http_get_json(f"https://api.modrinth.com/v2/project/{project_uuid}/versions")
+        except urllib.error.HTTPError as e:
+            if e.code != 404:
+                raise
+            _forget_project_id(project_id_or_slug)
+            fresh_uuid = resolve_modrinth_project_id(project_id_or_slug)
+            if fresh_uuid is None:
+                return _no_modrinth_versions()
+            if fresh_uuid == project_uuid:
+                raise
+            print(c(Color.YELLOW, f"[!] Cached project UUID {project_uuid} is stale; now {fresh_uuid}"), file=sys.stderr)
+            project_uuid = fresh_uuid
+            versions = _http_get_json(f"https://api.modrinth.com/v2/project/{project_uuid}/versions")
         
         # Extract all unique game_versions and pack versions
         game_versions = set()
-        pack_versions = {}
+        pack_versions = defaultdict(set)
         
         for version in versions:
             version_number = version.get('version_number', '')
@@ -182,13 +391,12 @@ def fetch_modrinth_versions(project_id_or_slug: str) -> dict:
             game_versions.update(game_vers)
             
             if version_number:
-                if version_number not in pack_versions:
-                    pack_versions[version_number] = []
-                pack_versions[version_number].extend(game_vers)
+                pack_versions[version_number].update(game_vers)
         
         return {
+            'project_id': project_uuid,
             'game_versions': game_versions,
-            'pack_versions': pack_versions
+            'pack_versions': dict(pack_versions)
         }
     
     except urllib.error.HTTPError as e:
@@ -202,38 +410,18 @@ def fetch_modrinth_versions(project_id_or_slug: str) -> dict:
         sys.exit(1)
 
 
-def find_missing_versions(
-    minecraft_releases: List[MinecraftVersion],
-    modrinth_versions: Set[str]
-) -> List[MinecraftVersion]:
-    """
-    Identify Minecraft versions not yet uploaded to Modrinth.
-    
-    Args:
-        minecraft_releases: All available Minecraft releases
-        modrinth_versions: Versions already on Modrinth
-    
-    Returns:
-        List of versions to upload
-    """
-    missing = [
-        release for release in minecraft_releases
-        if release.version not in modrinth_versions
-    ]
-    
-    return missing
-
-
 def group_by_pack_format(
-    minecraft_releases: List[MinecraftVersion],
+    releases_by_pf: Dict[int, List[str]],
     modrinth_data: dict,
     pack_version: str
 ) -> dict:
     """
-    Group Minecraft versions by pack_format and identify which groups need uploading.
+    Build a group per pack_format and identify which groups need uploading.
     
     Args:
-        minecraft_releases: All available Minecraft releases
+        releases_by_pf: Release version strings keyed by pack_format, as
+            returned by fetch_minecraft_releases_grouped (this used to take
+            a flat list of MinecraftVersion objects)
         modrinth_data: Dict with 'game_versions' set and 'pack_versions' dict from Modrinth
         pack_version: Current pack version from VERSION file (e.g., "1.0.0")
     
@@ -243,30 +431,19 @@ def group_by_pack_format(
     modrinth_game_versions = modrinth_data['game_versions']
     modrinth_pack_versions = modrinth_data['pack_versions']
     
-    # Group all versions by pack_format
     format_groups = {}
-    for release in minecraft_releases:
-        pf = release.pack_format
-        if pf not in format_groups:
-            format_groups[pf] = {
-                "pack_format": pf,
-                "versions": [],
-                "missing_versions": [],
-                "needs_upload": False
-            }
-        
-        format_groups[pf]["versions"].append(release.version)
-        
-        # Check if this specific Minecraft version is missing
-        if release.version not in modrinth_game_versions:
-            format_groups[pf]["missing_versions"].append(release.version)
-    
-    # For each group, determine version range and check if pack version exists
-    for pf, group in format_groups.items():
-        versions = group["versions"]
-        
-        # Sort versions (simple string sort works for most cases)
-        versions.sort()
+    for pf, versions in releases_by_pf.items():
+        # Ascending, so versions[0]/versions[-1] give the range
+        versions = sorted(versions, key=version_key)
+        # Built once per group for the comparison against Modrinth below
+        version_set = set(versions)
+        group = format_groups[pf] = {
+            "pack_format": pf,
+            "versions": versions,
+            # Minecraft versions in this group that Modrinth doesn't have yet
+            "missing_versions": [v for v in versions if v not in modrinth_game_versions],
+            "needs_upload": False
+        }
         
         # Create version range string
         if len(versions) == 1:
@@ -283,7 +460,7 @@ def group_by_pack_format(
         # 1. There are missing Minecraft versions, OR
         # 2. This specific pack version doesn't exist on Modrinth
         version_number = f"{pack_version}-pf{pf}"
-        existing_game_versions = modrinth_pack_versions.get(version_number, [])
+        existing_game_versions = modrinth_pack_versions.get(version_number, set())
         
         # Determine if we need to upload
         if version_number not in modrinth_pack_versions:
@@ -294,7 +471,7 @@ def group_by_pack_format(
             # There are new Minecraft versions not covered
             group["needs_upload"] = True
             group["upload_reason"] = f"New Minecraft versions: {', '.join(group['missing_versions'][:3])}{'...' if len(group['missing_versions']) > 3 else ''}"
-        elif set(existing_game_versions) != set(versions):
+        elif existing_game_versions != version_set:
             # Pack version exists but doesn't cover all expected game versions
             group["needs_upload"] = True
             group["upload_reason"] = "Game version list mismatch"
@@ -316,27 +493,38 @@ def main():
     
     # Get pack version from VERSION file
     pack_version = get_pack_version()
-    print(f"{Color.CYAN}[*] Pack version: {Color.BOLD}{pack_version}{Color.RESET}", file=sys.stderr)
+    print(c(Color.CYAN, f"[*] Pack version: {pack_version}"), file=sys.stderr)
     
-    print(f"{Color.BLUE}[*] Fetching Minecraft releases...{Color.RESET}", file=sys.stderr)
-    mc_releases = fetch_minecraft_releases()
-    print(f"{Color.GREEN}[+] Found {len(mc_releases)} Minecraft release versions{Color.RESET}", file=sys.stderr)
+    print(c(Color.BLUE, "[*] Fetching Minecraft releases..."), file=sys.stderr)
+    print(c(Color.BLUE, f"[*] Fetching Modrinth versions for project '{project_id}'..."), file=sys.stderr)
     
-    # Resolve project ID to UUID
-    print(f"{Color.BLUE}[*] Resolving Modrinth project '{project_id}'...{Color.RESET}", file=sys.stderr)
-    resolved_project_id = resolve_modrinth_project_id(project_id)
-    if resolved_project_id:
-        print(f"{Color.GREEN}[+] Resolved to project UUID: {resolved_project_id}{Color.RESET}", file=sys.stderr)
-    else:
-        resolved_project_id = None  # First upload, no UUID yet
+    # Both fetches are network-bound, so run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mc_future = executor.submit(fetch_minecraft_releases_grouped)
+        
+        # Resolve project ID to UUID (usually from the disk cache) while
+        # misode/mcmeta is fetched; the versions fetch needs the UUID
+        print(c(Color.BLUE, f"[*] Resolving Modrinth project '{project_id}'..."), file=sys.stderr)
+        resolved_project_id = resolve_modrinth_project_id(project_id)
+        if resolved_project_id:
+            print(c(Color.GREEN, f"[+] Resolved to project UUID: {resolved_project_id}"), file=sys.stderr)
+        else:
+            resolved_project_id = None  # First upload, no UUID yet
+        
+        modrinth_future = executor.submit(fetch_modrinth_versions, project_id, resolved_project_id)
+        releases_by_pf = mc_future.result()
+        modrinth_data = modrinth_future.result()
+    
+    # Differs from the resolved id if the cached UUID turned out to be stale
+    resolved_project_id = modrinth_data['project_id']
     
-    print(f"{Color.BLUE}[*] Fetching Modrinth versions for project '{project_id}'...{Color.RESET}", file=sys.stderr)
-    modrinth_data = fetch_modrinth_versions(project_id)
-    print(f"{Color.GREEN}[+] Found {len(modrinth_data['game_versions'])} game versions on Modrinth{Color.RESET}", file=sys.stderr)
-    print(f"{Color.GREEN}[+] Found {len(modrinth_data['pack_versions'])} pack versions on Modrinth{Color.RESET}", file=sys.stderr)
+    release_count = sum(len(versions) for versions in releases_by_pf.values())
+    print(c(Color.GREEN, f"[+] Found {release_count} Minecraft release versions"), file=sys.stderr)
+    print(c(Color.GREEN, f"[+] Found {len(modrinth_data['game_versions'])} game versions on Modrinth"), file=sys.stderr)
+    print(c(Color.GREEN, f"[+] Found {len(modrinth_data['pack_versions'])} pack versions on Modrinth"), file=sys.stderr)
     
     # Group by pack_format
-    format_groups = group_by_pack_format(mc_releases, modrinth_data, pack_version)
+    format_groups = group_by_pack_format(releases_by_pf, modrinth_data, pack_version)
     
     # Filter to only groups that need uploading
     groups_to_upload = {
@@ -345,11 +533,12 @@ def main():
     }
     
     if groups_to_upload:
-        print(f"{Color.YELLOW}[!] Found {len(groups_to_upload)} pack format groups to upload:{Color.RESET}", file=sys.stderr)
+        lines = [c(Color.YELLOW, f"[!] Found {len(groups_to_upload)} pack format groups to upload:")]
         for pf, group in sorted(groups_to_upload.items(), reverse=True):
-            print(f"    {Color.CYAN}- Pack Format {pf}: {group['upload_reason']} ({group['version_range']}){Color.RESET}", file=sys.stderr)
+            lines.append("    " + c(Color.CYAN, f"- Pack Format {pf}: {group['upload_reason']} ({group['version_range']})"))
+        sys.stderr.write("\n".join(lines) + "\n")
     else:
-        print(f"{Color.GREEN}[+] All pack formats are up-to-date!{Color.RESET}", file=sys.stderr)
+        print(c(Color.GREEN, "[+] All pack formats are up-to-date!"), file=sys.stderr)
     
     # Output JSON for workflow
     output = {
@@ -364,7 +553,8 @@ def main():
         "modrinth_pack_versions": list(modrinth_data['pack_versions'].keys()),
     }
     
-    print(json.dumps(output))
+    # One encode pass, one write; orjson appends the newline itself
+    sys.stdout.buffer.write(json_dumps(output, newline=True))
 
 
 if __name__ == "__main__":
@@ -5,10 +5,40 @@ Updates pack.mcmeta with version-specific pack_format and description.
 """
 
 import json
+import re
 import sys
 from pathlib import Path
 from typing import Optional
 
+# json_loads may use orjson, whose JSONDecodeError subclasses json.JSONDecodeError
+from pack_common import json_loads
+
+_PACK_FORMAT_RE = re.compile(rb'"pack_format"\s*:\s*-?\d+')
+_DESCRIPTION_RE = re.compile(rb'"description"\s*:\s*"(?:[^"\\]|\\.)*"')
+
+
+def _patch_pack_mcmeta(raw: bytes, data: dict, pack_format: int, description: str) -> Optional[bytes]:
+    """
+    Rewrite pack_format and description in the raw file, leaving every other
+    byte (formatting, key order, unrelated keys) untouched.
+    
+    Returns None when the keys can't be patched safely, e.g. a missing key or
+    a non-string description.
+    """
+    new_format = f'"pack_format": {pack_format}'.encode()
+    new_description = ('"description": ' + json.dumps(description, ensure_ascii=False)).encode("utf-8")
+    
+    text, format_count = _PACK_FORMAT_RE.subn(lambda m: new_format, raw, count=1)
+    text, description_count = _DESCRIPTION_RE.subn(lambda m: new_description, text, count=1)
+    if format_count != 1 or description_count != 1:
+        return None
+    
+    # Only accept the patch if it changed exactly the two keys under "pack"
+    expected = dict(data, pack=dict(data["pack"], pack_format=pack_format, description=description))
+    if json_loads(text) != expected:
+        return None
+    return text
+
 
 def update_pack_mcmeta(
     pack_mcmeta_path: str,
@@ -35,28 +65,29 @@ def update_pack_mcmeta(
             print(f"ERROR: pack.mcmeta not found at {pack_mcmeta_path}", file=sys.stderr)
             return False
         
-        with open(mcmeta_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        raw = mcmeta_file.read_bytes()
+        data = json_loads(raw)
         
         if "pack" not in data:
             print("ERROR: Invalid pack.mcmeta structure (missing 'pack' key)", file=sys.stderr)
             return False
         
-        # Update pack_format
-        data["pack"]["pack_format"] = pack_format
-        
         # Update description with version info
         if base_description is None:
             # Extract base description (everything before " (Auto-updated...")
             current_desc = data["pack"].get("description", "Resource Pack")
             base_description = current_desc.split(" (Auto-updated")[0].strip()
         
-        data["pack"]["description"] = f"{base_description} (Auto-updated for Minecraft {minecraft_version})"
+        description = f"{base_description} (Auto-updated for Minecraft {minecraft_version})"
+        
+        # Patch the two keys in place; fall back to a full re-serialization
+        updated = _patch_pack_mcmeta(raw, data, pack_format, description)
+        if updated is None:
+            data["pack"]["pack_format"] = pack_format
+            data["pack"]["description"] = description
+            updated = (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
         
-        # Write back with proper formatting
-        with open(mcmeta_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write('\n')
+        mcmeta_file.write_bytes(updated)
         
         print(f"[+] Updated pack.mcmeta for Minecraft {minecraft_version}", file=sys.stderr)
         return True
@@ -1,18 +1,475 @@
 #!/usr/bin/env python3
 """
 Modrinth Uploader
-Zips resource pack and uploads to Modrinth for a specific Minecraft version.
+Zips resource pack and uploads to Modrinth for a set of Minecraft versions.
+
+All game versions for a pack are passed in one call and attached to a single
+Modrinth version record, so the pack is zipped and uploaded once rather than
+once per Minecraft version.
 """
 
-import json
+import gzip
+import hashlib
+import http.client
+import io
+import mmap
 import os
-import shutil
+import stat
 import sys
-import urllib.request
-import urllib.error
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from pack_common import json_dumps, json_loads
+
+# python-isal is optional; its SIMD DEFLATE is several times faster than zlib
+try:
+    from isal import isal_zlib as _zlib
+except ImportError:
+    _zlib = zlib
+
+MODRINTH_API_HOST = "api.modrinth.com"
+USER_AGENT = 'XYZ-Classic-Panorama-Updater/1.0'
+
+# Already-compressed formats gain nothing from DEFLATE, so they are stored as-is
+STORED_SUFFIXES = frozenset({'.png', '.ogg', '.jpg', '.jpeg', '.zip'})
+
+# DEFLATE level for entries that are not stored
+COMPRESS_LEVEL = 1
+
+# Read size used when streaming the zip into the request body
+CHUNK_SIZE = 64 * 1024
+
+# Bodies up to this size are sent from memory; larger ones stream from disk
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Seconds to wait for "100 Continue" before sending the body anyway; servers
+# that ignore Expect stay silent until they have it
+EXPECT_CONTINUE_TIMEOUT = 1
+
+# Upload attempts on 5xx responses and network errors, with exponential backoff
+UPLOAD_ATTEMPTS = 5
+RETRY_MAX_DELAY = 32
+
+# Constant parts of the multipart envelope, built once
+_BOUNDARY = b"----WebKitFormBoundary7MA4YWxkTrZu0gW"
+_CONTENT_TYPE = f"multipart/form-data; boundary={_BOUNDARY.decode()}"
+_PART_DATA = (
+    b"--" + _BOUNDARY + b"\r\n"
+    b"Content-Disposition: form-data; name=\"data\"\r\n"
+    b"Content-Type: application/json\r\n\r\n"
+)
+_TRAILER = b"\r\n--" + _BOUNDARY + b"--\r\n"
+
+# Read size used when hashing the zip
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Keep-alive connection shared by every Modrinth request in this process
+_connection: Optional[http.client.HTTPSConnection] = None
+
+
+def _get_connection() -> http.client.HTTPSConnection:
+    """Return the shared Modrinth connection, creating it on first use."""
+    global _connection
+    if _connection is None:
+        _connection = http.client.HTTPSConnection(MODRINTH_API_HOST, timeout=30)
+    return _connection
+
+
+def close_client() -> None:
+    """Close the shared Modrinth connection, if one is open."""
+    global _connection
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+
+
+def _warm_connection() -> None:
+    """Open the shared connection ahead of the first request, if possible."""
+    try:
+        _get_connection().connect()
+    except OSError:
+        # The first request reconnects and reports the error itself
+        close_client()
+
+
+class _ReplayReader(io.RawIOBase):
+    """Raw stream that returns bytes already read off a socket file, then the rest of it."""
+    
+    def __init__(self, head: bytes, fp):
+        self._head = head
+        self._fp = fp
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, b):
+        if self._head:
+            n = min(len(b), len(self._head))
+            b[:n] = self._head[:n]
+            self._head = self._head[n:]
+            return n
+        data = self._fp.read1(len(b))
+        b[:len(data)] = data
+        return len(data)
+    
+    def close(self):
+        self._fp.close()
+        super().close()
+
+
+class _ReplaySocket:
+    """Just enough of a socket for http.client.HTTPResponse to parse a _ReplayReader."""
+    
+    def __init__(self, head: bytes, fp):
+        self._reader = io.BufferedReader(_ReplayReader(head, fp))
+    
+    def makefile(self, mode):
+        return self._reader
+
+
+def _send_expecting_continue(conn: http.client.HTTPConnection, method: str, path: str, body, headers: dict):
+    """
+    Send a request with Expect: 100-continue, holding the body back until the
+    server agrees to take it.
+    
+    A server that rejects the request from its headers alone (bad token,
+    body too large) answers with a final status instead; the body is then
+    never sent, and the connection is closed since the server may still be
+    waiting for it. If no interim response arrives within
+    EXPECT_CONTINUE_TIMEOUT, the body is sent anyway.
+    
+    Returns:
+        The http.client.HTTPResponse with its headers read
+    """
+    conn.putrequest(method, path, skip_accept_encoding=True)
+    for name, value in headers.items():
+        conn.putheader(name, value)
+    conn.putheader('Expect', '100-continue')
+    conn.endheaders()
+    
+    sock = conn.sock
+    fp = sock.makefile('rb')
+    sock.settimeout(EXPECT_CONTINUE_TIMEOUT)
+    try:
+        status_line = fp.readline(65537)
+    except TimeoutError:
+        status_line = None
+    finally:
+        sock.settimeout(conn.timeout)
+    
+    if status_line == b"":
+        fp.close()
+        raise http.client.RemoteDisconnected("Remote end closed connection without response")
+    if status_line is not None and status_line.split(None, 2)[1:2] != [b"100"]:
+        # Final status from the headers alone; parse it including the line already read
+        response = http.client.HTTPResponse(_ReplaySocket(status_line, fp), method=method)
+        response.begin()
+        conn.close()
+        return response
+    if status_line is not None:
+        # Skip the interim response's headers
+        http.client.parse_headers(fp)
+    fp.close()
+    
+    conn.send(body)
+    return conn.getresponse()
+
+
+def _exchange(conn: http.client.HTTPConnection, method: str, path: str, body, headers: dict, expect_continue: bool = False):
+    """Send one request on conn and return (status, decoded response body)."""
+    if expect_continue:
+        response = _send_expecting_continue(conn, method, path, body, headers)
+    else:
+        conn.request(method, path, body=body, headers=headers)
+        response = conn.getresponse()
+    data = response.read()
+    if response.getheader('Content-Encoding', '').lower() == 'gzip':
+        data = gzip.decompress(data)
+    return response.status, data
+
+
+def _request(method: str, path: str, body=None, headers: Optional[dict] = None, expect_continue: bool = False):
+    """
+    Send a request to the Modrinth API over the shared connection.
+    
+    A GET that fails because the server dropped an idle keep-alive socket is
+    resent once on a fresh connection. With expect_continue, the body is only
+    sent once the server has accepted the headers.
+    
+    Returns:
+        (status, response_body) tuple
+    """
+    request_headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip'}
+    request_headers.update(headers or {})
+    
+    conn = _get_connection()
+    reused = conn.sock is not None
+    try:
+        return _exchange(conn, method, path, body, request_headers, expect_continue)
+    except (ConnectionResetError, BrokenPipeError):
+        # Covers RemoteDisconnected; don't reuse a connection left in an unknown state
+        close_client()
+        if not (reused and method == 'GET'):
+            raise
+    except Exception:
+        close_client()
+        raise
+    
+    try:
+        return _exchange(_get_connection(), method, path, body, request_headers, expect_continue)
+    except Exception:
+        close_client()
+        raise
+
+
+def sha1_streaming(path: Path) -> str:
+    """Hash a file in fixed-size chunks without loading it into memory."""
+    with open(path, 'rb') as f:
+        # file_digest (3.11+) reads into one reusable buffer and hands it to
+        # OpenSSL, which uses the CPU's SHA extensions where available
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha1').hexdigest()
+        
+        h = hashlib.sha1()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def find_existing_version(file_hash: str) -> Optional[dict]:
+    """
+    Look up the Modrinth version that already hosts a file with this SHA-1.
+    
+    Returns:
+        The version object, or None if the file is unknown or the lookup failed
+    """
+    try:
+        status, data = _request('GET', f'/v2/version_file/{file_hash}?algorithm=sha1')
+        if status == 200:
+            return json_loads(data)
+    except Exception as e:
+        print(f"WARNING: Could not check Modrinth for an existing upload: {e}", file=sys.stderr)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _project_uuid(project_id: str) -> Optional[str]:
+    """
+    Resolve a project slug (or ID) to the project's UUID.
+    
+    Returns:
+        The UUID, or None if the project is unknown or the lookup failed
+    """
+    try:
+        status, data = _request('GET', f'/v2/project/{project_id}')
+        if status == 200:
+            return json_loads(data).get("id")
+    except Exception as e:
+        print(f"WARNING: Could not resolve Modrinth project {project_id}: {e}", file=sys.stderr)
+    return None
+
+
+def _is_project(version: dict, project_id: str) -> bool:
+    """
+    Check whether a version belongs to project_id.
+    
+    Versions always carry the project's UUID, while project_id may be a
+    slug, which is only resolved when the UUIDs don't already match.
+    """
+    version_project = version.get("project_id")
+    if not version_project:
+        return False
+    return version_project == project_id or version_project == _project_uuid(project_id)
+
+
+def _is_same_upload(existing: Optional[dict], metadata: dict) -> bool:
+    """
+    Check whether a version found by file hash is the upload described by metadata.
+    
+    It must belong to the same project, have the same version number and
+    already cover every requested game version.
+    """
+    return (
+        existing is not None
+        and _is_project(existing, metadata["project_id"])
+        and existing.get("version_number") == metadata["version_number"]
+        and set(metadata["game_versions"]) <= set(existing.get("game_versions") or ())
+    )
+
+
+def _map_file(path: Path) -> mmap.mmap:
+    """Map a file read-only; the mapping stays valid after the file is closed."""
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _iter_multipart(head: bytes, mm: mmap.mmap, tail: bytes):
+    """
+    Yield the multipart body, slicing the zip out of its mapping, then unmap it.
+    
+    Each slice is released as soon as the caller asks for the next one, or
+    when the generator is closed part way (a failed send), so the mapping
+    can always be closed.
+    """
+    try:
+        yield head
+        with memoryview(mm) as view:
+            for offset in range(0, len(view), CHUNK_SIZE):
+                chunk = view[offset:offset + CHUNK_SIZE]
+                try:
+                    yield chunk
+                finally:
+                    with suppress(BufferError):
+                        chunk.release()
+        yield tail
+    finally:
+        # Still exported if a caller kept a buffer of its own over a slice;
+        # the mapping is then freed once that buffer goes away
+        with suppress(BufferError):
+            mm.close()
+
+
+def _file_part_header(filename: str) -> bytes:
+    """Return the multipart header that precedes the zip, ending the data part."""
+    return (
+        b"\r\n--" + _BOUNDARY + b"\r\n"
+        b"Content-Disposition: form-data; name=\"file\"; filename=\"" + filename.encode() + b"\"\r\n"
+        b"Content-Type: application/zip\r\n\r\n"
+    )
+
+
+def _multipart_body(head: bytes, zip_path: Path, tail: bytes, content_length: int):
+    """
+    Return the multipart body as one buffer when small, else as a disk stream.
+    
+    The zip is mapped here rather than on first iteration, so errors reading
+    it are raised before any request is made.
+    """
+    mm = _map_file(zip_path)
+    if content_length <= SPOOL_MAX_SIZE:
+        with mm:
+            return b"".join((head, mm, tail))
+    return _iter_multipart(head, mm, tail)
+
+
+def _deflate_file(path: Path):
+    """
+    Stream one file through raw DEFLATE, as zipfile itself would.
+    
+    Runs on worker threads: the compressor releases the GIL while compressing.
+    Only the compressed output is held in memory, never the whole file.
+    
+    Returns:
+        (crc32, compressed_bytes, uncompressed_size)
+    """
+    crc = 0
+    size = 0
+    compressed = []
+    compressor = _zlib.compressobj(COMPRESS_LEVEL, _zlib.DEFLATED, -15)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            crc = _zlib.crc32(chunk, crc)
+            size += len(chunk)
+            compressed.append(compressor.compress(chunk))
+    compressed.append(compressor.flush())
+    return crc, b"".join(compressed), size
+
+
+# Private ZipFile members _write_deflated relies on; checked per archive so a
+# zipfile change falls back to plain zf.write instead of corrupting output
+_ZIPFILE_INTERNALS = ('_lock', '_writecheck', '_didModify', 'start_dir', 'fp')
+
+# Python versions whose zipfile has been checked to produce the same archive
+# through _write_deflated as through zf.write (tests/test_upload_modrinth.py)
+_ZIPFILE_VERIFIED = {(3, 11), (3, 12), (3, 13)}
+
+
+def _can_write_deflated(zf: zipfile.ZipFile) -> bool:
+    """Return True if zf is from a verified zipfile and exposes everything _write_deflated needs."""
+    return (
+        sys.version_info[:2] in _ZIPFILE_VERIFIED
+        and all(hasattr(zf, name) for name in _ZIPFILE_INTERNALS)
+        and hasattr(zipfile.ZipInfo, 'FileHeader')
+    )
+
+
+def _write_deflated(zf: zipfile.ZipFile, path: Path, arcname: str, deflated) -> None:
+    """
+    Append an entry whose data was already compressed by _deflate_file.
+    
+    zipfile has no public API for precompressed data, so this follows what
+    ZipFile.mkdir does for raw entries: write the local header and data at
+    the end of the archive and register the entry for the central directory.
+    """
+    crc, compressed, size = deflated
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC = crc
+    zinfo.file_size = size
+    zinfo.compress_size = len(compressed)
+    
+    with zf._lock:
+        zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.fp.tell()
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zf.fp.write(zinfo.FileHeader())
+        zf.fp.write(compressed)
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _write_entry(zf: zipfile.ZipFile, source_path: Path, path: Path, deflated) -> None:
+    """Write one archive entry, from precompressed data when a future is given."""
+    arcname = path.relative_to(source_path).as_posix()
+    if deflated is not None:
+        _write_deflated(zf, path, arcname, deflated.result())
+    elif path.suffix.lower() in STORED_SUFFIXES:
+        zf.write(path, arcname, compress_type=zipfile.ZIP_STORED)
+    else:
+        zf.write(path, arcname)
+
+
+def _scan_dir(directory: Path, files: list) -> None:
+    """Append each file under directory, depth-first in name order."""
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            _scan_dir(Path(entry.path), files)
+        elif entry.is_file():
+            files.append(Path(entry.path))
+
+
+def _collect_files(source_path: Path, include_files: list) -> list:
+    """
+    Walk include_files once, warning about missing items.
+    
+    Returns:
+        File paths in archive order
+    """
+    files = []
+    for item in include_files:
+        src = source_path / item
+        try:
+            st = src.stat()
+        except FileNotFoundError:
+            print(f"WARNING: {item} not found at {src}", file=sys.stderr)
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            _scan_dir(src, files)
+        elif stat.S_ISREG(st.st_mode):
+            files.append(src)
+    return files
+
 
 def create_zip(
     source_dir: str,
@@ -38,35 +495,27 @@ def create_zip(
         source_path = Path(source_dir)
         zip_path = Path(output_zip)
         
-        # Verify all files exist
-        for item in include_files:
-            item_path = source_path / item
-            if not item_path.exists():
-                print(f"WARNING: {item} not found at {item_path}", file=sys.stderr)
-        
-        # Create temporary directory for zip contents
-        temp_dir = zip_path.parent / f"{zip_path.stem}_temp"
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-        temp_dir.mkdir(parents=True)
-        
-        # Copy files to temp directory
-        for item in include_files:
-            src = source_path / item
-            dst = temp_dir / item
-            
-            if src.is_dir():
-                shutil.copytree(src, dst, dirs_exist_ok=True)
-            elif src.is_file():
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
-        
-        # Create zip from temp directory
-        zip_path_without_ext = zip_path.with_suffix('')
-        shutil.make_archive(str(zip_path_without_ext), 'zip', temp_dir)
-        
-        # Cleanup temp directory
-        shutil.rmtree(temp_dir)
+        zip_path.parent.mkdir(parents=True, exist_ok=True)
+        # One walk verifies the inputs and fixes the archive order
+        files = _collect_files(source_path, include_files)
+        
+        # Write files straight from the source tree into the archive
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL, allowZip64=True) as zf, \
+                ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # Compress on all cores; entries are still written in order, and only
+            # a small window of compressed results is held in memory at once
+            precompress = _can_write_deflated(zf)
+            window = 2 * (os.cpu_count() or 1)
+            pending = deque()
+            for path in files:
+                if precompress and path.suffix.lower() not in STORED_SUFFIXES:
+                    pending.append((path, executor.submit(_deflate_file, path)))
+                else:
+                    pending.append((path, None))
+                if len(pending) >= window:
+                    _write_entry(zf, source_path, *pending.popleft())
+            while pending:
+                _write_entry(zf, source_path, *pending.popleft())
         
         zip_size = zip_path.stat().st_size
         print(f"[+] Created zip: {output_zip} ({zip_size:,} bytes)", file=sys.stderr)
@@ -77,6 +526,56 @@ def create_zip(
         return False
 
 
+def _post_version(head: bytes, zip_file: Path, content_length: int, api_token: str, file_hash: str, metadata: dict):
+    """
+    POST a new version, retrying 5xx responses and network errors with backoff.
+    
+    Modrinth has no resumable upload, so each attempt resends the whole body.
+    Before a retry the file hash is looked up first, so an attempt that was
+    stored despite a failed response is not uploaded twice.
+    
+    Returns:
+        (status, response_body) tuple, or (None, version) if an earlier
+        attempt turned out to have succeeded
+    """
+    for attempt in range(1, UPLOAD_ATTEMPTS + 1):
+        if attempt > 1:
+            existing = find_existing_version(file_hash)
+            if _is_same_upload(existing, metadata):
+                return None, existing
+        
+        # Small packs go out in a single send; large ones stream instead of sitting
+        # in memory. Built outside the try: a zip that can't be read is not a
+        # network failure and should not be retried
+        body = _multipart_body(head, zip_file, _TRAILER, content_length)
+        try:
+            status, response_data = _request(
+                'POST',
+                '/v2/version',
+                body=body,
+                headers={
+                    'Authorization': api_token,
+                    'Content-Type': _CONTENT_TYPE,
+                    'Content-Length': str(content_length),
+                },
+                # A rejected token or oversized pack fails before the zip is sent
+                expect_continue=True,
+            )
+        except (OSError, http.client.HTTPException) as e:
+            # Connection resets, timeouts and truncated responses
+            if attempt == UPLOAD_ATTEMPTS:
+                raise
+            reason = str(e) or type(e).__name__
+        else:
+            if status < 500 or attempt == UPLOAD_ATTEMPTS:
+                return status, response_data
+            reason = f"HTTP {status}"
+        
+        delay = min(2 ** (attempt - 1), RETRY_MAX_DELAY)
+        print(f"WARNING: Upload attempt {attempt} failed ({reason}); retrying in {delay}s", file=sys.stderr)
+        time.sleep(delay)
+
+
 def upload_to_modrinth(
     zip_path: str,
     project_id: str,
@@ -119,13 +618,6 @@ def upload_to_modrinth(
             print(f"ERROR: Zip file not found: {zip_path}", file=sys.stderr)
             return False
         
-        # Read zip file
-        with open(zip_file, 'rb') as f:
-            zip_data = f.read()
-        
-        # Prepare request
-        url = f"https://api.modrinth.com/v2/version"
-        
         body = {
             "name": version_name,
             "version_number": version_number,
@@ -139,48 +631,49 @@ def upload_to_modrinth(
             "file_parts": ["data"]
         }
         
-        # Create multipart request
-        boundary = "----WebKitFormBoundary7MA4YWxkTrZu0gW"
-        
-        body_str = json.dumps(body)
-        
-        multipart_body = (
-            f"--{boundary}\r\n"
-            f"Content-Disposition: form-data; name=\"data\"\r\n"
-            f"Content-Type: application/json\r\n\r\n"
-            f"{body_str}\r\n"
-            f"--{boundary}\r\n"
-            f"Content-Disposition: form-data; name=\"file\"; filename=\"{zip_file.name}\"\r\n"
-            f"Content-Type: application/zip\r\n\r\n"
-        ).encode() + zip_data + f"\r\n--{boundary}--\r\n".encode()
+        # Skip the upload only when this exact version already carries these bytes
+        file_hash = sha1_streaming(zip_file)
+        existing = find_existing_version(file_hash)
+        if _is_same_upload(existing, body):
+            print(f"[=] Version {version_number} already has this file on Modrinth; skipping upload", file=sys.stderr)
+            return True
+        if existing and _is_project(existing, project_id):
+            # Modrinth rejects duplicate files, and a silent skip would leave this version unpublished
+            print(
+                f"ERROR: This zip is already published as version {existing.get('version_number')} "
+                f"({', '.join(existing.get('game_versions') or [])}); cannot upload it again as {version_number}",
+                file=sys.stderr
+            )
+            return False
         
-        request = urllib.request.Request(url, data=multipart_body)
-        request.add_header('Authorization', api_token)
-        request.add_header('Content-Type', f'multipart/form-data; boundary={boundary}')
-        request.add_header('User-Agent', 'XYZ-Classic-Panorama-Updater/1.0')
+        # Only the JSON metadata and filename vary between uploads
+        multipart_head = b"".join((_PART_DATA, json_dumps(body), _file_part_header(zip_file.name)))
+        content_length = len(multipart_head) + zip_file.stat().st_size + len(_TRAILER)
         
         print(f"[*] Uploading to Modrinth ({zip_file.stat().st_size:,} bytes)...", file=sys.stderr)
         print(f"    Project ID: {project_id}", file=sys.stderr)
         print(f"    Version: {version_number}", file=sys.stderr)
         print(f"    Supported versions: {', '.join(game_versions)}", file=sys.stderr)
         
-        with urllib.request.urlopen(request, timeout=30) as response:
-            response_data = response.read().decode()
-            if len(game_versions) == 1:
-                print(f"[+] Upload successful for Minecraft {game_versions[0]}", file=sys.stderr)
-            else:
-                print(f"[+] Upload successful for {len(game_versions)} Minecraft versions ({game_versions[0]} - {game_versions[-1]})", file=sys.stderr)
-            print(f"    Response: {response_data[:100]}...", file=sys.stderr)
+        status, response_data = _post_version(multipart_head, zip_file, content_length, api_token, file_hash, body)
+        if status is None:
+            print(f"[=] Upload landed despite the error; Modrinth has it as version {response_data.get('version_number')}", file=sys.stderr)
             return True
+        
+        if status >= 400:
+            error_body = response_data[:200].decode('utf-8', 'replace')
+            print(f"ERROR: Modrinth API error ({status}): {error_body}", file=sys.stderr)
+            return False
+        
+        # Only the logged prefix is ever decoded
+        response_data = response_data[:100].decode('utf-8', 'replace')
+        if len(game_versions) == 1:
+            print(f"[+] Upload successful for Minecraft {game_versions[0]}", file=sys.stderr)
+        else:
+            print(f"[+] Upload successful for {len(game_versions)} Minecraft versions ({game_versions[0]} - {game_versions[-1]})", file=sys.stderr)
+        print(f"    Response: {response_data}...", file=sys.stderr)
+        return True
     
-    except urllib.error.HTTPError as e:
-        error_body = ""
-        try:
-            error_body = e.read().decode()
-        except:
-            pass
-        print(f"ERROR: Modrinth API error ({e.code}): {error_body[:200]}", file=sys.stderr)
-        return False
     except Exception as e:
         print(f"ERROR: Upload failed: {e}", file=sys.stderr)
         return False
@@ -190,7 +683,7 @@ def main():
     """Main entry point."""
     if len(sys.argv) < 6:
         print(
-            "Usage: python3 upload_modrinth.py <project_id> <version_number> <game_versions_json> <api_token> <pack_dir> [output_zip] [version_name]",
+            "Usage: python3 upload_modrinth.py <project_id> <version_number> <game_versions_csv> <api_token> <pack_dir> [output_zip] [version_name]",
             file=sys.stderr
         )
         sys.exit(1)
@@ -200,29 +693,35 @@ def main():
     game_versions_csv = sys.argv[3]  # Comma-separated string like "1.21.4,1.21.3"
     api_token = sys.argv[4]
     
-    # Parse comma-separated versions
-    if game_versions_csv:
-        game_versions = [v.strip() for v in game_versions_csv.split(',') if v.strip()]
-    else:
-        print(f"{Color.RED}ERROR: No game versions provided{Color.RESET}", file=sys.stderr)
+    # Parse comma-separated versions; every one of them goes into a single upload
+    game_versions = list(dict.fromkeys(v.strip() for v in game_versions_csv.split(',') if v.strip()))
+    if not game_versions:
+        print("ERROR: No game versions provided", file=sys.stderr)
         sys.exit(1)
     pack_dir = sys.argv[5]
     output_zip = sys.argv[6] if len(sys.argv) > 6 else f"XYZ-{version_number}.zip"
     version_name = sys.argv[7] if len(sys.argv) > 7 else None
     
-    # Create zip
-    if not create_zip(pack_dir, output_zip):
-        sys.exit(1)
-    
-    # Upload to Modrinth
-    if not upload_to_modrinth(output_zip, project_id, game_versions, version_number, api_token, version_name):
+    try:
+        # Create zip while the TLS handshake with Modrinth happens in the background
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(_warm_connection)
+            zipped = create_zip(pack_dir, output_zip)
+        if not zipped:
+            sys.exit(1)
+        
+        # Upload to Modrinth
+        uploaded = upload_to_modrinth(output_zip, project_id, game_versions, version_number, api_token, version_name)
+    finally:
+        close_client()
+    if not uploaded:
         sys.exit(1)
     
     # Cleanup zip
     try:
         os.remove(output_zip)
         print(f"[+] Cleaned up temporary zip file", file=sys.stderr)
-    except:
+    except Exception:
         pass
     
     print("[+] Upload workflow complete", file=sys.stderr)
@@ -0,0 +1,33 @@
+"""
+Shared fixtures for the script tests.
+
+The scripts import each other by name, as they do when run from scripts/,
+so that directory goes on sys.path before any test module imports them.
+"""
+
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+
+@pytest.fixture
+def serve():
+    """Start a local HTTP server for a handler class and return its port."""
+    servers = []
+
+    def start(handler_cls) -> int:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        servers.append(server)
+        return server.server_address[1]
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
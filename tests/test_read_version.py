@@ -0,0 +1,66 @@
+"""Tests for read_version.py."""
+
+import subprocess
+
+import pytest
+
+import read_version
+
+
+def _git(*args):
+    subprocess.run(["git", *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A repository with tags on main and a higher tag on an unmerged branch."""
+    monkeypatch.chdir(tmp_path)
+    for var, value in (("NAME", "Pack Bot"), ("EMAIL", "bot@example.com")):
+        monkeypatch.setenv(f"GIT_AUTHOR_{var}", value)
+        monkeypatch.setenv(f"GIT_COMMITTER_{var}", value)
+    _git("init", "-q", "-b", "main")
+    _git("commit", "-q", "--allow-empty", "-m", "one")
+    _git("tag", "1.9.0")
+    _git("commit", "-q", "--allow-empty", "-m", "two")
+    _git("tag", "-a", "-m", "release", "1.10.0")
+    _git("tag", "1.10.0-rc1")
+    _git("checkout", "-q", "-b", "experiment")
+    _git("commit", "-q", "--allow-empty", "-m", "three")
+    _git("tag", "2.0.0")
+    _git("checkout", "-q", "main")
+    _git("commit", "-q", "--allow-empty", "-m", "four")
+    read_version.read_latest_tag.cache_clear()
+    yield tmp_path
+    read_version.read_latest_tag.cache_clear()
+
+
+def test_latest_tag_from_git(repo, monkeypatch):
+    monkeypatch.setattr(read_version, "Repo", None)
+
+    assert read_version.read_latest_tag() == "1.10.0"
+
+
+def test_latest_tag_from_dulwich(repo):
+    pytest.importorskip("dulwich")
+
+    assert read_version.read_latest_tag() == "1.10.0"
+
+
+def test_dulwich_failure_falls_back_to_git(repo, monkeypatch):
+    class BrokenRepo:
+        @staticmethod
+        def discover():
+            raise OSError("unsupported repository")
+
+    monkeypatch.setattr(read_version, "Repo", BrokenRepo)
+
+    assert read_version.read_latest_tag() == "1.10.0"
+
+
+def test_no_tags(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(read_version, "Repo", None)
+    read_version.read_latest_tag.cache_clear()
+
+    assert read_version.read_latest_tag() is None
+    read_version.read_latest_tag.cache_clear()
@@ -0,0 +1,201 @@
+"""Tests for resolve_versions.py."""
+
+import json
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+import resolve_versions
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Serves one JSON document with an ETag and honours If-None-Match."""
+
+    body = b'{"id": "AABBCCDD"}'
+    etag = '"v1"'
+    requests = []
+
+    def do_GET(self):
+        type(self).requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/missing":
+            self.send_error(404)
+        elif self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", str(len(self.body)))
+            self.end_headers()
+            self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def etag_server(serve, tmp_path, monkeypatch):
+    monkeypatch.setattr(resolve_versions, "HTTP_CACHE_DIR", tmp_path / "cache")
+    handler = type("Handler", (_ETagHandler,), {"requests": []})
+    return f"http://127.0.0.1:{serve(handler)}", handler
+
+
+def test_http_get_revalidates_with_etag(etag_server):
+    base, handler = etag_server
+
+    first = resolve_versions._http_get(f"{base}/doc")
+    second = resolve_versions._http_get(f"{base}/doc")
+
+    assert first == second
+    assert second.read_bytes() == _ETagHandler.body
+    assert handler.requests == [("/doc", None), ("/doc", '"v1"')]
+
+
+def test_http_get_refreshes_changed_body(etag_server):
+    base, handler = etag_server
+    resolve_versions._http_get(f"{base}/doc")
+
+    handler.body = b'{"id": "EEFF0011"}'
+    handler.etag = '"v2"'
+
+    assert resolve_versions._http_get_json(f"{base}/doc") == {"id": "EEFF0011"}
+    assert resolve_versions._http_get(f"{base}/doc").read_bytes() == handler.body
+    assert handler.requests[-1] == ("/doc", '"v2"')
+
+
+def test_http_get_raises_other_errors(etag_server):
+    base, _ = etag_server
+
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        resolve_versions._http_get(f"{base}/missing")
+    assert excinfo.value.code == 404
+
+
+def test_group_by_pack_format_upload_reasons():
+    releases_by_pf = {46: ["1.21.4"], 42: ["1.21.3", "1.21.2"], 34: ["1.21", "1.21.1"], 15: ["1.20.1", "1.20"]}
+    modrinth_data = {
+        "game_versions": {"1.21.4", "1.21.3", "1.21.2", "1.21", "1.21.1", "1.20"},
+        "pack_versions": {
+            "1.0.0-pf46": {"1.21.4"},
+            "1.0.0-pf42": {"1.21.2"},
+            "1.0.0-pf15": {"1.20"},
+        },
+    }
+
+    groups = resolve_versions.group_by_pack_format(releases_by_pf, modrinth_data, "1.0.0")
+
+    assert groups[46]["upload_reason"] == "Up-to-date"
+    assert not groups[46]["needs_upload"]
+    assert groups[42]["upload_reason"] == "Game version list mismatch"
+    assert groups[34]["upload_reason"] == "Pack version 1.0.0 not on Modrinth for PF34"
+    assert groups[15]["upload_reason"] == "New Minecraft versions: 1.20.1"
+    assert groups[15]["versions"] == ["1.20", "1.20.1"]
+    assert groups[15]["version_range"] == "1.20-1.20.1"
+    assert all(groups[pf]["needs_upload"] for pf in (42, 34, 15))
+
+
+@pytest.fixture
+def modrinth_api(tmp_path, monkeypatch):
+    """Replace _http_get_json with canned Modrinth responses, recording each URL."""
+    monkeypatch.setattr(resolve_versions, "HTTP_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(resolve_versions, "PROJECT_ID_CACHE", tmp_path / "modrinth_project_ids.json")
+    responses = {}
+    calls = []
+
+    def http_get_json(url, timeout=10):
+        calls.append(url)
+        if url not in responses:
+            raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+        return responses[url]
+
+    monkeypatch.setattr(resolve_versions, "_http_get_json", http_get_json)
+    return responses, calls
+
+
+API = "https://api.modrinth.com/v2/project"
+
+
+def test_fetch_modrinth_versions_uses_resolved_uuid(modrinth_api):
+    responses, calls = modrinth_api
+    responses[f"{API}/AABBCCDD/versions"] = [
+        {"version_number": "1.0.0-pf46", "game_versions": ["1.21.4"]},
+        {"version_number": "1.0.0-pf42", "game_versions": ["1.21.2", "1.21.3"]},
+    ]
+
+    data = resolve_versions.fetch_modrinth_versions("classic-panorama", "AABBCCDD")
+
+    assert data["project_id"] == "AABBCCDD"
+    assert data["game_versions"] == {"1.21.4", "1.21.3", "1.21.2"}
+    assert data["pack_versions"] == {"1.0.0-pf46": {"1.21.4"}, "1.0.0-pf42": {"1.21.2", "1.21.3"}}
+    assert calls == [f"{API}/AABBCCDD/versions"]
+
+
+def test_fetch_modrinth_versions_for_new_project_makes_no_request(modrinth_api):
+    _, calls = modrinth_api
+
+    assert resolve_versions.fetch_modrinth_versions("classic-panorama", None) == {
+        "project_id": None, "game_versions": set(), "pack_versions": {}
+    }
+    assert calls == []
+
+
+def test_resolve_project_id_is_cached_on_disk(modrinth_api):
+    responses, calls = modrinth_api
+    responses[f"{API}/classic-panorama"] = {"id": "AABBCCDD", "slug": "classic-panorama"}
+
+    assert resolve_versions.resolve_modrinth_project_id("classic-panorama") == "AABBCCDD"
+    assert resolve_versions.resolve_modrinth_project_id("classic-panorama") == "AABBCCDD"
+    assert calls == [f"{API}/classic-panorama"]
+
+
+def test_resolve_project_id_for_new_project(modrinth_api):
+    assert resolve_versions.resolve_modrinth_project_id("classic-panorama") is None
+
+
+def _cache_project_id(slug, pid, age=0):
+    resolve_versions.PROJECT_ID_CACHE.write_text(json.dumps({slug: {"id": pid, "cached_at": time.time() - age}}))
+
+
+def test_resolve_project_id_cache_expires(modrinth_api):
+    responses, calls = modrinth_api
+    responses[f"{API}/classic-panorama"] = {"id": "EEFF0011"}
+    _cache_project_id("classic-panorama", "AABBCCDD", age=resolve_versions.PROJECT_ID_CACHE_TTL + 60)
+
+    assert resolve_versions.resolve_modrinth_project_id("classic-panorama") == "EEFF0011"
+    assert calls == [f"{API}/classic-panorama"]
+
+
+def test_stale_cached_uuid_is_resolved_again(modrinth_api):
+    responses, calls = modrinth_api
+    responses[f"{API}/classic-panorama"] = {"id": "EEFF0011"}
+    responses[f"{API}/EEFF0011/versions"] = [{"version_number": "1.0.0-pf46", "game_versions": ["1.21.4"]}]
+    _cache_project_id("classic-panorama", "AABBCCDD")
+
+    pid = resolve_versions.resolve_modrinth_project_id("classic-panorama")
+    data = resolve_versions.fetch_modrinth_versions("classic-panorama", pid)
+
+    assert data["project_id"] == "EEFF0011"
+    assert data["game_versions"] == {"1.21.4"}
+    assert calls == [f"{API}/AABBCCDD/versions", f"{API}/classic-panorama", f"{API}/EEFF0011/versions"]
+    assert json.loads(resolve_versions.PROJECT_ID_CACHE.read_text())["classic-panorama"]["id"] == "EEFF0011"
+
+
+def test_stale_cached_uuid_of_deleted_project(modrinth_api):
+    _, calls = modrinth_api
+    _cache_project_id("classic-panorama", "AABBCCDD")
+
+    data = resolve_versions.fetch_modrinth_versions("classic-panorama", "AABBCCDD")
+
+    assert data == {"project_id": None, "game_versions": set(), "pack_versions": {}}
+    assert json.loads(resolve_versions.PROJECT_ID_CACHE.read_text()) == {}
+
+
+def test_versions_404_for_fresh_uuid_exits(modrinth_api):
+    responses, calls = modrinth_api
+    responses[f"{API}/classic-panorama"] = {"id": "AABBCCDD"}
+
+    with pytest.raises(SystemExit):
+        resolve_versions.fetch_modrinth_versions("classic-panorama", "AABBCCDD")
+    assert calls == [f"{API}/AABBCCDD/versions", f"{API}/classic-panorama"]
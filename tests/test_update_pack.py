@@ -0,0 +1,71 @@
+"""Tests for update_pack.py."""
+
+import json
+
+import update_pack
+
+
+def _update(tmp_path, raw: bytes, base_description=None) -> bytes:
+    path = tmp_path / "pack.mcmeta"
+    path.write_bytes(raw)
+    assert update_pack.update_pack_mcmeta(str(path), "1.21.4", 46, base_description)
+    return path.read_bytes()
+
+
+def test_patch_keeps_formatting_and_other_keys(tmp_path):
+    raw = (
+        b'{\n'
+        b'    "pack": {\n'
+        b'        "pack_format": 34,\n'
+        b'        "description": "Classic \\"panorama\\" (Auto-updated for Minecraft 1.21)",\n'
+        b'        "supported_formats": [34, 46]\n'
+        b'    },\n'
+        b'    "overlays": {"entries": []}\n'
+        b'}\n'
+    )
+
+    updated = _update(tmp_path, raw)
+
+    assert updated == raw.replace(b"34,\n", b"46,\n").replace(b"1.21)", b"1.21.4)")
+    assert json.loads(updated)["pack"]["description"] == 'Classic "panorama" (Auto-updated for Minecraft 1.21.4)'
+
+
+def test_patch_only_touches_keys_under_pack(tmp_path):
+    # The first "description" in the file is not the pack's, so the patch is rejected
+    raw = b'{"meta": {"description": "other"}, "pack": {"pack_format": 34, "description": "Pack"}}'
+
+    data = json.loads(_update(tmp_path, raw))
+
+    assert data["meta"] == {"description": "other"}
+    assert data["pack"] == {"pack_format": 46, "description": "Pack (Auto-updated for Minecraft 1.21.4)"}
+
+
+def test_text_component_description_falls_back_to_reserialization(tmp_path):
+    raw = b'{"pack": {"pack_format": 34, "description": {"text": "Pack"}}}'
+
+    updated = _update(tmp_path, raw, base_description="Pack")
+
+    assert updated == (
+        b'{\n'
+        b'  "pack": {\n'
+        b'    "pack_format": 46,\n'
+        b'    "description": "Pack (Auto-updated for Minecraft 1.21.4)"\n'
+        b'  }\n'
+        b'}\n'
+    )
+
+
+def test_missing_description_falls_back_to_reserialization(tmp_path):
+    raw = b'{"pack": {"pack_format": 34}}'
+
+    data = json.loads(_update(tmp_path, raw))
+
+    assert data == {"pack": {"pack_format": 46, "description": "Resource Pack (Auto-updated for Minecraft 1.21.4)"}}
+
+
+def test_invalid_json_fails(tmp_path):
+    path = tmp_path / "pack.mcmeta"
+    path.write_bytes(b'{"pack": ')
+
+    assert not update_pack.update_pack_mcmeta(str(path), "1.21.4", 46)
+    assert path.read_bytes() == b'{"pack": '
@@ -0,0 +1,320 @@
+"""Tests for upload_modrinth.py against a local stand-in for the Modrinth API."""
+
+import http.client
+import json
+import zipfile
+import zlib
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+import upload_modrinth
+
+PROJECT_UUID = "AABBCCDD"
+PROJECT_SLUG = "classic-panorama"
+
+
+class _ModrinthHandler(BaseHTTPRequestHandler):
+    """
+    Minimal Modrinth API: version lookups by file hash and version uploads.
+
+    Class attributes hold the state; each test gets its own subclass.
+    """
+
+    protocol_version = "HTTP/1.1"
+    files = {}
+    posts = []
+    expects = []
+    project_lookups = 0
+    fail_posts = 0
+    store_failed_posts = False
+    drop_after_response = False
+    ignore_expect = False
+
+    def _reply(self, status: int, body: bytes = b"") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Close without announcing it, as a server timing out an idle socket does
+        self.close_connection = type(self).drop_after_response
+
+    def handle_expect_100(self):
+        type(self).expects.append(self.headers["Authorization"])
+        if self.headers["Authorization"] == "bad":
+            self._reply(401, b'{"error": "unauthorized"}')
+            self.close_connection = True
+            return False
+        if self.ignore_expect:
+            return True
+        return super().handle_expect_100()
+
+    def do_GET(self):
+        if self.path.startswith("/v2/version_file/"):
+            file_hash = self.path.split("/")[3].split("?")[0]
+            version = self.files.get(file_hash)
+            if version is None:
+                self._reply(404)
+            else:
+                self._reply(200, json.dumps(version).encode())
+        elif self.path == f"/v2/project/{PROJECT_SLUG}":
+            type(self).project_lookups += 1
+            self._reply(200, json.dumps({"id": PROJECT_UUID, "slug": PROJECT_SLUG}).encode())
+        else:
+            self._reply(404)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        cls = type(self)
+        cls.posts.append(body)
+        metadata = json.loads(body.split(b"\r\n\r\n", 1)[1].split(b"\r\n--", 1)[0])
+        file_hash = self.headers.get("X-Test-Hash")
+        if cls.fail_posts:
+            cls.fail_posts -= 1
+            if cls.store_failed_posts and file_hash:
+                cls.files[file_hash] = metadata
+            self._reply(502, b"Bad Gateway")
+            return
+        self._reply(200, json.dumps({"id": "NEWVERSION", **metadata}).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def modrinth(serve, monkeypatch):
+    """Point the shared connection at a fresh local Modrinth stand-in."""
+    handler = type("Handler", (_ModrinthHandler,), {"files": {}, "posts": [], "expects": []})
+    port = serve(handler)
+
+    def get_connection():
+        if upload_modrinth._connection is None:
+            upload_modrinth._connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        return upload_modrinth._connection
+
+    monkeypatch.setattr(upload_modrinth, "_get_connection", get_connection)
+    monkeypatch.setattr(upload_modrinth.time, "sleep", lambda seconds: None)
+    upload_modrinth._project_uuid.cache_clear()
+    yield handler
+    upload_modrinth.close_client()
+
+
+@pytest.fixture
+def pack_zip(tmp_path):
+    zip_path = tmp_path / "pack.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("pack.mcmeta", '{"pack": {"pack_format": 46, "description": "Pack"}}')
+    return zip_path
+
+
+def _upload(zip_path, version_number="1.0.0-pf46", game_versions=("1.21.4",), api_token="token", project_id=PROJECT_UUID):
+    return upload_modrinth.upload_to_modrinth(
+        str(zip_path), project_id, list(game_versions), version_number, api_token
+    )
+
+
+def _version(version_number="1.0.0-pf46", game_versions=("1.21.4",)):
+    return {"project_id": PROJECT_UUID, "version_number": version_number, "game_versions": list(game_versions)}
+
+
+def test_upload_posts_version(modrinth, pack_zip):
+    assert _upload(pack_zip)
+
+    assert len(modrinth.posts) == 1
+    assert pack_zip.read_bytes() in modrinth.posts[0]
+
+
+def test_upload_streams_large_body_after_continue(modrinth, pack_zip, monkeypatch):
+    monkeypatch.setattr(upload_modrinth, "SPOOL_MAX_SIZE", 16)
+
+    assert _upload(pack_zip)
+    assert modrinth.expects == ["token"]
+    assert pack_zip.read_bytes() in modrinth.posts[0]
+
+
+def test_upload_rejected_before_body_is_sent(modrinth, pack_zip, capsys):
+    assert not _upload(pack_zip, api_token="bad")
+
+    assert modrinth.expects == ["bad"]
+    assert modrinth.posts == []
+    assert "Modrinth API error (401)" in capsys.readouterr().err
+    # The connection the body was held back on is not reused
+    assert upload_modrinth._connection is None or upload_modrinth._connection.sock is None
+
+
+def test_upload_sends_body_when_server_ignores_expect(modrinth, pack_zip, monkeypatch):
+    monkeypatch.setattr(upload_modrinth, "EXPECT_CONTINUE_TIMEOUT", 0.1)
+    modrinth.ignore_expect = True
+
+    assert _upload(pack_zip)
+    assert len(modrinth.posts) == 1
+
+
+def test_upload_skipped_when_version_already_has_file(modrinth, pack_zip):
+    modrinth.files[upload_modrinth.sha1_streaming(pack_zip)] = _version(game_versions=("1.21.3", "1.21.4"))
+
+    assert _upload(pack_zip)
+    assert modrinth.posts == []
+
+
+def test_upload_skipped_by_slug_when_version_already_has_file(modrinth, pack_zip):
+    modrinth.files[upload_modrinth.sha1_streaming(pack_zip)] = _version()
+
+    assert _upload(pack_zip, project_id=PROJECT_SLUG)
+    assert modrinth.posts == []
+    assert modrinth.project_lookups == 1
+
+
+def test_upload_by_uuid_does_not_resolve_project(modrinth, pack_zip):
+    modrinth.files[upload_modrinth.sha1_streaming(pack_zip)] = _version()
+
+    assert _upload(pack_zip)
+    assert modrinth.project_lookups == 0
+
+
+def test_upload_refused_by_slug_when_file_belongs_to_other_version(modrinth, pack_zip):
+    modrinth.files[upload_modrinth.sha1_streaming(pack_zip)] = _version(version_number="0.9.0-pf46")
+
+    assert not _upload(pack_zip, project_id=PROJECT_SLUG)
+    assert modrinth.posts == []
+
+
+def test_upload_refused_when_file_belongs_to_other_version(modrinth, pack_zip, capsys):
+    modrinth.files[upload_modrinth.sha1_streaming(pack_zip)] = _version(version_number="0.9.0-pf46")
+
+    assert not _upload(pack_zip)
+    assert modrinth.posts == []
+    assert "already published as version 0.9.0-pf46" in capsys.readouterr().err
+
+
+def test_upload_not_skipped_for_missing_game_versions(modrinth, pack_zip):
+    modrinth.files[upload_modrinth.sha1_streaming(pack_zip)] = _version()
+
+    # Same bytes and version number, but 1.21.5 is not covered yet
+    assert not _upload(pack_zip, game_versions=("1.21.4", "1.21.5"))
+    assert modrinth.posts == []
+
+
+def test_upload_retries_server_errors(modrinth, pack_zip):
+    modrinth.fail_posts = 2
+
+    assert _upload(pack_zip)
+    assert len(modrinth.posts) == 3
+
+
+def test_upload_not_repeated_when_failed_attempt_was_stored(modrinth, pack_zip, monkeypatch):
+    # Tag the POST with the file hash so the stand-in can record the version it "lost"
+    file_hash = upload_modrinth.sha1_streaming(pack_zip)
+    real_request = upload_modrinth._request
+
+    def tagged_request(method, path, body=None, headers=None, **kwargs):
+        if method == "POST":
+            headers = dict(headers, **{"X-Test-Hash": file_hash})
+        return real_request(method, path, body, headers, **kwargs)
+
+    monkeypatch.setattr(upload_modrinth, "_request", tagged_request)
+    modrinth.fail_posts = 1
+    modrinth.store_failed_posts = True
+
+    assert _upload(pack_zip)
+    assert len(modrinth.posts) == 1
+
+
+def test_get_resent_when_kept_alive_socket_was_dropped(modrinth):
+    modrinth.drop_after_response = True
+
+    assert upload_modrinth._request("GET", "/v2/version_file/abc")[0] == 404
+    # The server has closed the socket the connection still holds
+    assert upload_modrinth._request("GET", "/v2/version_file/abc")[0] == 404
+
+
+def test_post_not_resent_on_dropped_socket(modrinth):
+    modrinth.drop_after_response = True
+    upload_modrinth._request("GET", "/v2/version_file/abc")
+
+    with pytest.raises((ConnectionResetError, BrokenPipeError)):
+        upload_modrinth._request("POST", "/v2/version", body=b"x", headers={"Content-Length": "1"})
+    assert modrinth.posts == []
+
+
+@pytest.fixture
+def large_file(tmp_path):
+    path = tmp_path / "large.zip"
+    path.write_bytes(bytes(range(256)) * (3 * upload_modrinth.CHUNK_SIZE // 256 + 7))
+    return path
+
+
+def test_multipart_stream_yields_whole_body(large_file):
+    mm = upload_modrinth._map_file(large_file)
+    parts = [bytes(part) for part in upload_modrinth._iter_multipart(b"head", mm, b"tail")]
+
+    assert b"".join(parts) == b"head" + large_file.read_bytes() + b"tail"
+    assert len(parts) == 6
+    assert mm.closed
+
+
+def test_multipart_stream_closed_part_way_unmaps_file(large_file):
+    mm = upload_modrinth._map_file(large_file)
+    body = upload_modrinth._iter_multipart(b"head", mm, b"tail")
+    next(body)
+    # Held by the caller, as http.client's send loop does when sending fails
+    chunk = next(body)
+
+    body.close()
+
+    assert mm.closed
+    with pytest.raises(ValueError):
+        bytes(chunk)
+
+
+def test_multipart_stream_tolerates_exported_slice(large_file):
+    mm = upload_modrinth._map_file(large_file)
+    body = upload_modrinth._iter_multipart(b"head", mm, b"tail")
+    next(body)
+    exported = memoryview(next(body))
+
+    body.close()
+
+    assert bytes(exported[:4]) == large_file.read_bytes()[:4]
+    exported.release()
+
+
+def _make_pack(root):
+    (root / "assets" / "minecraft" / "textures").mkdir(parents=True)
+    (root / "assets" / "minecraft" / "lang").mkdir(parents=True)
+    (root / "pack.mcmeta").write_text('{"pack": {"pack_format": 46, "description": "Pack"}}')
+    (root / "assets" / "minecraft" / "textures" / "panorama_0.png").write_bytes(bytes(range(256)) * 64)
+    for i in range(20):
+        (root / "assets" / "minecraft" / "lang" / f"lang_{i:02}.json").write_text(json.dumps({"key": "value " * i * 50}))
+    (root / "assets" / "minecraft" / "empty.txt").write_bytes(b"")
+    # Larger than CHUNK_SIZE, so _deflate_file compresses it in several pieces
+    (root / "assets" / "minecraft" / "lang" / "en_us.json").write_text(
+        json.dumps({f"key.{i}": f"value {i * i}" for i in range(20000)})
+    )
+
+
+def test_zip_fast_path_matches_zipfile(tmp_path, monkeypatch):
+    _make_pack(tmp_path / "pack")
+    # Byte-for-byte equality needs the same DEFLATE implementation on both paths
+    monkeypatch.setattr(upload_modrinth, "_zlib", zlib)
+    precompressed = []
+    real_write_deflated = upload_modrinth._write_deflated
+
+    def write_deflated(zf, path, arcname, deflated):
+        precompressed.append(arcname)
+        real_write_deflated(zf, path, arcname, deflated)
+
+    monkeypatch.setattr(upload_modrinth, "_write_deflated", write_deflated)
+    assert upload_modrinth.create_zip(str(tmp_path / "pack"), str(tmp_path / "fast.zip"))
+    assert len(precompressed) == 23
+
+    monkeypatch.setattr(upload_modrinth, "_can_write_deflated", lambda zf: False)
+    assert upload_modrinth.create_zip(str(tmp_path / "pack"), str(tmp_path / "plain.zip"))
+
+    fast = (tmp_path / "fast.zip").read_bytes()
+    assert fast == (tmp_path / "plain.zip").read_bytes()
+    with zipfile.ZipFile(tmp_path / "fast.zip") as zf:
+        assert zf.testzip() is None
+        assert len(zf.namelist()) == 24
+        assert zf.getinfo("assets/minecraft/textures/panorama_0.png").compress_type == zipfile.ZIP_STORED